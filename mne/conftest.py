@@ -19,6 +19,7 @@ import numpy as np
 import mne
 from mne.datasets import testing
 from mne.fixes import has_numba
+from mne.minimum_norm import time_frequency as mn_time_frequency
 from mne.stats import cluster_level
 from mne.utils import _pl, _assert_no_instances, numerics
 
@@ -615,6 +616,11 @@ def numba_conditional(monkeypatch, request):
             cluster_level, '_where_first', cluster_level._where_first_fallback)
         monkeypatch.setattr(
             numerics, '_arange_div', numerics._arange_div_fallback)
+        for name in ('_abs2_accumulate', '_abs2_xyz_accumulate',
+                     '_unit_phasor_accumulate'):
+            monkeypatch.setattr(
+                mn_time_frequency, name,
+                getattr(mn_time_frequency, name + '_fallback'))
     if request.param == 'Numba' and not has_numba:
         pytest.skip('Numba not installed')
     yield request.param
@@ -7,6 +7,8 @@
 
 from copy import deepcopy
 from math import sqrt
+import weakref
+
 import numpy as np
 
 from ._eloreta import _compute_eloreta
@@ -652,6 +654,21 @@ def prepare_inverse_operator(orig, nave, lambda2, method='dSPM',
     return InverseOperator(inv)
 
 
+def _scaled_eigen_leads(inv):
+    """Return sqrt(source_cov) * eigen_leads, cached on the inverse."""
+    eigen_leads = inv['eigen_leads']['data']
+    source_cov = inv['source_cov']['data']
+    entry = inv.get('_scaled_eigen_leads')
+    # recompute if the underlying arrays have been replaced; weak references
+    # compared by identity cannot be fooled by recycled allocations
+    if entry is None or entry[0]() is not eigen_leads or \
+            entry[1]() is not source_cov:
+        scaled = np.sqrt(source_cov)[:, np.newaxis] * eigen_leads
+        entry = (weakref.ref(eigen_leads), weakref.ref(source_cov), scaled)
+        inv['_scaled_eigen_leads'] = entry
+    return entry[2]
+
+
 @verbose
 def _assemble_kernel(inv, label, method, pick_ori, use_cps=True, verbose=None):
     """Assemble the kernel.
@@ -702,6 +719,21 @@ def _assemble_kernel(inv, label, method, pick_ori, use_cps=True, verbose=None):
     vertno = _get_vertno(src)
     source_nn = inv['source_nn']
 
+    # vector or normal, might need to rotate
+    norm_rot = (pick_ori == 'normal' and
+                all(s['type'] == 'surf' for s in src) and
+                np.allclose(inv['source_nn'].reshape(inv['nsource'], 3, 3),
+                            np.eye(3), atol=1e-6))
+
+    eigen_leads_weighted = inv['eigen_leads_weighted']
+    if not eigen_leads_weighted and not norm_rot:
+        # fold R^0.5 into the eigenleads up front (row scaling commutes with
+        # the trans GEMM) and cache the result on the inverse so repeated
+        # kernel assemblies skip the sqrt and broadcast multiply; when the
+        # normals get rotated below the scaling is applied to K as before
+        eigen_leads = _scaled_eigen_leads(inv)
+        eigen_leads_weighted = True
+
     if label is not None:
         vertno, src_sel = label_src_vertno_sel(label, src)
 
@@ -717,10 +749,7 @@ def _assemble_kernel(inv, label, method, pick_ori, use_cps=True, verbose=None):
         source_cov = source_cov[src_sel]
         source_nn = source_nn[src_sel]
 
-    # vector or normal, might need to rotate
-    if pick_ori == 'normal' and all(s['type'] == 'surf' for s in src) and \
-            np.allclose(inv['source_nn'].reshape(inv['nsource'], 3, 3),
-                        np.eye(3), atol=1e-6):
+    if norm_rot:
         offset = 0
         eigen_leads = np.reshape(
             eigen_leads, (-1, 3, eigen_leads.shape[1])).copy()
@@ -745,6 +774,8 @@ def _assemble_kernel(inv, label, method, pick_ori, use_cps=True, verbose=None):
             raise ValueError('Picking normal orientation can only be done '
                              'when working with loose orientations.')
 
+    # right-associate the product: whitener @ proj stays (n_ch, n_ch), which
+    # is much cheaper than first forming eigen_fields @ whitener
     trans = np.dot(inv['eigen_fields']['data'],
                    np.dot(inv['whitener'], inv['proj']))
     trans *= inv['reginv'][:, None]
@@ -754,7 +785,7 @@ def _assemble_kernel(inv, label, method, pick_ori, use_cps=True, verbose=None):
     #   with the weights computed above
     #
     K = np.dot(eigen_leads, trans)
-    if inv['eigen_leads_weighted']:
+    if eigen_leads_weighted:
         #
         #     R^0.5 has been already factored in
         #
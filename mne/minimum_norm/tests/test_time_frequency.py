@@ -14,9 +14,12 @@ from mne.minimum_norm import (read_inverse_operator, apply_inverse_epochs,
 from mne.minimum_norm.time_frequency import (source_band_induced_power,
                                              source_induced_power,
                                              compute_source_psd,
-                                             compute_source_psd_epochs)
+                                             compute_source_psd_epochs,
+                                             _compute_pow_plv, _mean_bands,
+                                             _source_induced_power)
 
 
+from mne.time_frequency import morlet
 from mne.time_frequency.multitaper import psd_array_multitaper
 
 data_path = testing.data_path(download=False)
@@ -205,3 +208,95 @@ def test_source_psd_epochs(method):
             one_epochs, inv, lambda2=lambda2, method=method,
             pick_ori="normal", label=label, bandwidth=0.01, low_bias=True,
             fmin=fmin, fmax=fmax, return_generator=False, prepared=True)
+
+
+def test_mean_bands():
+    """Test one-pass band averaging against a naive per-band loop."""
+    rng = np.random.RandomState(0)
+    df = 0.5
+    # alpha overshoots band[1] by up to df / 2 (those freqs are excluded
+    # from the mean) and gamma ends exactly at the last frequency
+    bands = [[8, 9.3], [13, 30], [31, 40]]
+    freqs_per_band = [np.arange(band[0], band[1] + df / 2.0, df)
+                      for band in bands]
+    assert freqs_per_band[0][-1] > bands[0][1]  # overshoot present
+    assert freqs_per_band[-1][-1] == bands[-1][1]  # ends on the last freq
+    n_freqs = sum(len(f) for f in freqs_per_band)
+    powers = rng.rand(6, n_freqs, 11)
+    band_powers = _mean_bands(powers, freqs_per_band, bands)
+    assert band_powers.shape == (6, len(bands), 11)
+    start = 0
+    for bi, (freqs, band) in enumerate(zip(freqs_per_band, bands)):
+        block = powers[:, start:start + len(freqs)]
+        naive = block[:, freqs <= band[1]].mean(axis=1)
+        assert_allclose(band_powers[:, bi], naive)
+        start += len(freqs)
+
+
+@pytest.mark.parametrize('source_ori, n_kernel_rows, pick_ori', [
+    (FIFF.FIFFV_MNE_FREE_ORI, 15, None),
+    (FIFF.FIFFV_MNE_FREE_ORI, 15, 'normal'),
+    (FIFF.FIFFV_MNE_FIXED_ORI, 5, None),
+])
+def test_compute_pow_plv_dtype(numba_conditional, source_ori, n_kernel_rows,
+                               pick_ori):
+    """Test single precision induced power against double precision."""
+    rng = np.random.RandomState(0)
+    data = rng.randn(3, 10, 200)  # long enough that no wavelet warning fires
+    K = rng.randn(n_kernel_rows, 10)
+    Ws = morlet(250., [10., 20.], n_cycles=3)
+    kwargs = dict(K=K, Ws=Ws, source_ori=source_ori, use_fft=True,
+                  with_power=True, with_plv=True, pick_ori=pick_ori, decim=1)
+    power64, plv64 = _compute_pow_plv(data, dtype=np.float64, **kwargs)
+    power32, plv32 = _compute_pow_plv(data, dtype=np.float32, **kwargs)
+    assert power64.dtype == np.float64
+    assert power32.dtype == np.float32
+    assert plv64.dtype == np.complex128
+    assert plv32.dtype == np.complex64
+    assert_allclose(power32, power64, rtol=2e-3, atol=1e-5 * power64.max())
+    assert_allclose(plv32, plv64, rtol=2e-3, atol=1e-5 * len(data))
+
+
+def test_source_induced_power_split(numba_conditional, monkeypatch):
+    """Test epoch-split vs frequency-split parallel paths and dtype."""
+    import mne.minimum_norm.time_frequency as mn_tf
+
+    rng = np.random.RandomState(0)
+    n_epochs, n_ch, n_times = 2, 10, 100
+    data = rng.randn(n_epochs, n_ch, n_times)
+    K = rng.randn(15, n_ch)
+    # with pick_ori='normal' the kernel rows map one-to-one to sources
+    noise_norm = rng.rand(15, 1)
+
+    class _FakeEpochs(object):
+        info = dict(sfreq=250.)
+        ch_names = ['CH %d' % ii for ii in range(n_ch)]
+
+        def get_data(self):
+            return data
+
+    monkeypatch.setattr(
+        mn_tf, '_prepare_source_params',
+        lambda **kwargs: (K, list(range(n_ch)), None, None, True, noise_norm))
+    epochs = _FakeEpochs()
+    inv = dict(source_ori=FIFF.FIFFV_MNE_FREE_ORI)
+    freqs = [10., 15., 20.]
+    kwargs = dict(n_cycles=2, pick_ori='normal', use_fft=True, prepared=True)
+
+    power, plv, _ = _source_induced_power(epochs, inv, freqs, n_jobs=1,
+                                          **kwargs)
+    # more jobs than epochs triggers the frequency split
+    power_fs, plv_fs, _ = _source_induced_power(epochs, inv, freqs, n_jobs=4,
+                                                **kwargs)
+    assert power.shape == (15, len(freqs), n_times)
+    assert_allclose(power_fs, power, rtol=1e-12)
+    assert_allclose(plv_fs, plv, rtol=1e-12)
+
+    power_32, plv_32, _ = _source_induced_power(epochs, inv, freqs, n_jobs=1,
+                                                dtype=np.float32, **kwargs)
+    assert power_32.dtype == np.float32
+    assert_allclose(power_32, power, rtol=2e-3, atol=1e-5 * power.max())
+    assert_allclose(plv_32, plv, rtol=2e-3, atol=1e-5)
+
+    with pytest.raises(ValueError, match="Invalid value for the 'dtype'"):
+        _source_induced_power(epochs, inv, freqs, dtype=np.int32, **kwargs)
@@ -3,6 +3,10 @@
 #
 # License: BSD-3-Clause
 
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+
 import numpy as np
 
 from ..epochs import Epochs, make_fixed_length_events
@@ -17,25 +21,87 @@ from ..baseline import rescale, _log_rescale
 from .inverse import (combine_xyz, _check_or_prepare, _assemble_kernel,
                       _pick_channels_inverse_operator, INVERSE_METHODS,
                       _check_ori, _subject_from_inverse)
+from ..fixes import has_numba, jit
 from ..parallel import parallel_func
 from ..utils import logger, verbose, ProgressBar, _check_option
 
 
-def _prepare_source_params(inst, inverse_operator, label=None,
-                           lambda2=1.0 / 9.0, method="dSPM", nave=1,
-                           decim=1, pca=True, pick_ori="normal",
-                           prepared=False, method_params=None,
-                           use_cps=True, verbose=None):
-    """Prepare inverse operator and params for spectral / TFR analysis."""
+# target number of time-frequency columns per projection GEMM: wide enough
+# to amortize BLAS packing overhead even with heavy decimation, narrow
+# enough to bound the size of the solution buffer for large source spaces
+_PROJ_GEMM_COLS = 4096
+
+
+def _abs2_accumulate_fallback(sol, out):
+    out += sol.real ** 2
+    out += sol.imag ** 2
+
+
+def _unit_phasor_accumulate_fallback(sol, out):
+    out += sol / np.abs(sol)
+
+
+def _abs2_xyz_accumulate_fallback(sol, out):
+    # einsum contracts the three orientation components in one pass, without
+    # the per-component squared-slice temporaries combine_xyz allocates
+    sol = sol.reshape(len(out), 3, -1)
+    out += np.einsum('ikj,ikj->ij', sol.real, sol.real)
+    out += np.einsum('ikj,ikj->ij', sol.imag, sol.imag)
+
+
+# the fixes.jit wrapper passes cache=True, so these kernels compile once
+# per machine and signature and load from the on-disk cache afterwards
+if has_numba:
+    @jit()
+    def _abs2_accumulate(sol, out):
+        # single pass over sol instead of two squared-magnitude passes
+        for i in range(sol.shape[0]):
+            for j in range(sol.shape[1]):
+                v = sol[i, j]
+                out[i, j] += v.real * v.real + v.imag * v.imag
+
+    @jit()
+    def _abs2_xyz_accumulate(sol, out):
+        # one pass over sol instead of two strided combine_xyz traversals
+        for i in range(out.shape[0]):
+            for j in range(out.shape[1]):
+                s = 0.
+                for k in range(3):
+                    v = sol[3 * i + k, j]
+                    s += v.real * v.real + v.imag * v.imag
+                out[i, j] += s
+
+    @jit()
+    def _unit_phasor_accumulate(sol, out):
+        # fuse the abs, divide, and accumulate into a single pass
+        for i in range(sol.shape[0]):
+            for j in range(sol.shape[1]):
+                v = sol[i, j]
+                out[i, j] += v / abs(v)
+else:  # pragma: no cover
+    _abs2_accumulate = _abs2_accumulate_fallback
+    _abs2_xyz_accumulate = _abs2_xyz_accumulate_fallback
+    _unit_phasor_accumulate = _unit_phasor_accumulate_fallback
+
+
+# Preparing the inverse operator, assembling the kernel, and reducing its
+# rank involve an SVD of the kernel, all of which is identical when the same
+# inverse operator and parameters are reused (e.g., looping over conditions
+# or in realtime applications), so keep the last few results around. Entries
+# hold weak references and are validated by identity on each hit, which
+# protects against replaced or garbage-collected operators (recycled ids).
+# In-place mutation of the arrays inside a cached operator is not detected;
+# a prepared InverseOperator is treated as read-only, as elsewhere in MNE.
+_source_params_cache = OrderedDict()
+_SOURCE_PARAMS_CACHE_SIZE = 8
+
+
+def _prepare_kernel(inverse_operator, label, lambda2, method, nave, pca,
+                    pick_ori, prepared, method_params, use_cps):
+    """Prepare the inverse and assemble (+ optionally rank-reduce) K."""
     from scipy import linalg
     inv = _check_or_prepare(inverse_operator, nave, lambda2, method,
                             method_params, prepared)
-
-    #
-    #   Pick the correct channels from the data
-    #
-    sel = _pick_channels_inverse_operator(inst.ch_names, inv)
-    logger.info('Picked %d channels from the data' % len(sel))
     logger.info('Computing inverse...')
     #
     #   Simple matrix multiplication followed by combination of the
@@ -50,23 +116,101 @@ def _prepare_source_params(inst, inverse_operator, label=None,
     if pca:
         U, s, Vh = linalg.svd(K, full_matrices=False)
         rank = np.sum(s > 1e-8 * s[0])
-        K = s[:rank] * U[:, :rank]
-        Vh = Vh[:rank]
-        logger.info('Reducing data rank %d -> %d' % (len(s), rank))
+        if rank < K.shape[1]:
+            logger.info('Reducing data rank %d -> %d' % (K.shape[1], rank))
+            K = s[:rank] * U[:, :rank]
+            Vh = Vh[:rank]
+        else:
+            # Vh is square here, so projecting the data would not reduce
+            # the number of signals to transform -- keep the assembled
+            # kernel and skip the projection entirely
+            Vh = None
+            logger.info('Data rank %d not reduced, skipping projection'
+                        % rank)
     else:
         Vh = None
     is_free_ori = inverse_operator['source_ori'] == FIFF.FIFFV_MNE_FREE_ORI
 
+    return K, noise_norm, vertno, Vh, is_free_ori
+
+
+def _prepare_kernel_cached(inverse_operator, label, lambda2, method, nave,
+                           pca, pick_ori, prepared, method_params, use_cps):
+    """Memoized version of _prepare_kernel."""
+    if method_params is not None:  # unhashable and rarely reused: skip cache
+        return _prepare_kernel(inverse_operator, label, lambda2, method,
+                               nave, pca, pick_ori, prepared, method_params,
+                               use_cps)
+    key = (id(inverse_operator), id(label), lambda2, method, nave, pca,
+           pick_ori, prepared, use_cps)
+    entry = _source_params_cache.get(key)
+    if entry is not None:
+        inv_ref, label_ref, out = entry
+        # make sure the ids were not recycled for different objects
+        if inv_ref() is inverse_operator and \
+                (label is None or label_ref() is label):
+            _source_params_cache.move_to_end(key)
+            return out
+    out = _prepare_kernel(inverse_operator, label, lambda2, method, nave,
+                          pca, pick_ori, prepared, method_params, use_cps)
+    _source_params_cache[key] = (
+        weakref.ref(inverse_operator),
+        weakref.ref(label) if label is not None else None, out)
+    while len(_source_params_cache) > _SOURCE_PARAMS_CACHE_SIZE:
+        _source_params_cache.popitem(last=False)
+    return out
+
+
+def _prepare_source_params(inst, inverse_operator, label=None,
+                           lambda2=1.0 / 9.0, method="dSPM", nave=1,
+                           decim=1, pca=True, pick_ori="normal",
+                           prepared=False, method_params=None,
+                           use_cps=True, verbose=None):
+    """Prepare inverse operator and params for spectral / TFR analysis."""
+    #
+    #   Pick the correct channels from the data
+    #
+    sel = _pick_channels_inverse_operator(inst.ch_names, inverse_operator)
+    logger.info('Picked %d channels from the data' % len(sel))
+    K, noise_norm, vertno, Vh, is_free_ori = _prepare_kernel_cached(
+        inverse_operator, label, lambda2, method, nave, pca, pick_ori,
+        prepared, method_params, use_cps)
+
     return K, sel, Vh, vertno, is_free_ori, noise_norm
 
 
+def _mean_bands(powers, freqs_per_band, bands):
+    """Average power over the frequencies of each band in a single pass.
+
+    The frequency axis of ``powers`` is the concatenation of the per-band
+    frequency blocks, so each band is a contiguous slice and all band means
+    can be computed with one np.add.reduceat traversal instead of one
+    fancy-indexed copy per band.
+    """
+    lengths = np.array([len(f) for f in freqs_per_band])
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    # the arange defining each block can overshoot band[1] by up to df / 2;
+    # such frequencies are excluded from the mean
+    counts = np.array([np.sum(f <= band[1])
+                       for f, band in zip(freqs_per_band, bands)])
+    bounds = np.empty(2 * len(starts), dtype=int)
+    bounds[0::2] = starts
+    bounds[1::2] = starts + counts
+    if bounds[-1] == powers.shape[1]:  # reduceat indices must stay in range
+        bounds = bounds[:-1]
+    band_powers = np.add.reduceat(powers, bounds, axis=1)[:, ::2]
+    band_powers /= counts[np.newaxis, :, np.newaxis]
+    return band_powers
+
+
 @verbose
 def source_band_induced_power(epochs, inverse_operator, bands, label=None,
                               lambda2=1.0 / 9.0, method="dSPM", nave=1,
                               n_cycles=5, df=1, use_fft=False, decim=1,
                               baseline=None, baseline_mode='logratio',
                               pca=True, n_jobs=1, prepared=False,
-                              method_params=None, use_cps=True, verbose=None):
+                              method_params=None, use_cps=True,
+                              dtype=np.float64, verbose=None):
     """Compute source space induced power in given frequency bands.
 
     Parameters
@@ -128,6 +272,12 @@ def source_band_induced_power(epochs, inverse_operator, bands, label=None,
     %(use_cps_restricted)s
 
         .. versionadded:: 0.20
+    dtype : np.float64 | np.float32
+        Precision of the computation. Using np.float32 halves the memory
+        traffic of the pipeline and is usually sufficient for power
+        estimates. Defaults to np.float64.
+
+        .. versionadded:: 0.24
     %(verbose)s
 
     Returns
@@ -137,25 +287,28 @@ def source_band_induced_power(epochs, inverse_operator, bands, label=None,
     """  # noqa: E501
     _check_option('method', method, INVERSE_METHODS)
 
-    freqs = np.concatenate([np.arange(band[0], band[1] + df / 2.0, df)
-                            for _, band in bands.items()])
+    freqs_per_band = [np.arange(band[0], band[1] + df / 2.0, df)
+                      for band in bands.values()]
+    freqs = np.concatenate(freqs_per_band)
 
     powers, _, vertno = _source_induced_power(
         epochs, inverse_operator, freqs, label=label, lambda2=lambda2,
         method=method, nave=nave, n_cycles=n_cycles, decim=decim,
         use_fft=use_fft, pca=pca, n_jobs=n_jobs, with_plv=False,
-        prepared=prepared, method_params=method_params, use_cps=use_cps)
+        prepared=prepared, method_params=method_params, use_cps=use_cps,
+        dtype=dtype)
 
     Fs = epochs.info['sfreq']  # sampling in Hz
     stcs = dict()
 
     subject = _subject_from_inverse(inverse_operator)
     _log_rescale(baseline, baseline_mode)  # for early failure
-    for name, band in bands.items():
-        idx = [k for k, f in enumerate(freqs) if band[0] <= f <= band[1]]
 
-        # average power in band + mean over epochs
-        power = np.mean(powers[:, idx, :], axis=1)
+    # average power in band + mean over epochs (all bands in one pass)
+    band_powers = _mean_bands(powers, freqs_per_band, bands.values())
+
+    for k, name in enumerate(bands):
+        power = band_powers[:, k]
 
         # Run baseline correction
         power = rescale(power, epochs.times[::decim], baseline, baseline_mode,
@@ -172,6 +325,20 @@ def source_band_induced_power(epochs, inverse_operator, bands, label=None,
     return stcs
 
 
+@lru_cache(maxsize=32)
+def _cached_morlet(sfreq, freqs, n_cycles, zero_mean):
+    """Build Morlet wavelets, memoized over (hashable) parameters.
+
+    Wavelet construction is identical across repeated calls with the same
+    sampling rate and frequency grid (band loops, realtime use), so return
+    the same (immutable) tuple of wavelets instead of rebuilding them.
+    """
+    if isinstance(n_cycles, tuple):
+        n_cycles = np.array(n_cycles)
+    return tuple(morlet(sfreq, freqs, n_cycles=n_cycles,
+                        zero_mean=zero_mean))
+
+
 def _prepare_tfr(data, decim, pick_ori, Ws, K, source_ori):
     """Prepare TFR source localization."""
     n_times = data[:, :, ::decim].shape[2]
@@ -187,78 +354,82 @@ def _prepare_tfr(data, decim, pick_ori, Ws, K, source_ori):
 
 
 @verbose
-def _compute_pow_plv(data, K, sel, Ws, source_ori, use_fft, Vh,
-                     with_power, with_plv, pick_ori, decim, verbose=None):
-    """Aux function for induced power and PLV."""
+def _compute_pow_plv(data, K, Ws, source_ori, use_fft,
+                     with_power, with_plv, pick_ori, decim,
+                     dtype=np.float64, verbose=None):
+    """Aux function for induced power and PLV.
+
+    ``data`` must already be channel-selected and rank-reduced (this happens
+    once in _source_induced_power rather than once per worker).
+    """
+    dtype = np.dtype(dtype)
+    c_dtype = np.result_type(dtype, np.complex64)
     shape, is_free_ori = _prepare_tfr(data, decim, pick_ori, Ws, K, source_ori)
-    power = np.zeros(shape, dtype=np.float64)  # power or raw TFR
+    power = np.zeros(shape, dtype=dtype)  # power or raw TFR
     # phase lock
-    plv = np.zeros(shape, dtype=np.complex128) if with_plv else None
-
-    for epoch in data:
-        epoch = epoch[sel]  # keep only selected channels
+    plv = np.zeros(shape, dtype=c_dtype) if with_plv else None
 
-        if Vh is not None:
-            epoch = np.dot(Vh, epoch)  # reducing data rank
+    # cast once (to a contiguous array) so np.dot hits a single GEMM per
+    # frequency instead of promoting K on every call
+    K = K.astype(c_dtype)
 
-        power_e, plv_e = _single_epoch_tfr(
+    # reuse the GEMM output buffer across frequencies and epochs instead of
+    # allocating (and page-faulting) a fresh solution per np.dot call
+    n_freqs_block = max(1, min(len(Ws), _PROJ_GEMM_COLS // shape[2]))
+    sol = np.empty((K.shape[0], n_freqs_block * shape[2]), dtype=c_dtype)
+    for epoch in data:
+        _single_epoch_tfr(
             data=epoch, is_free_ori=is_free_ori, K=K, Ws=Ws, use_fft=use_fft,
-            decim=decim, shape=shape, with_plv=with_plv, with_power=with_power)
-
-        power += power_e
-        if with_plv:
-            plv += plv_e
+            decim=decim, power=power, plv=plv, sol=sol,
+            with_plv=with_plv, with_power=with_power)
 
     return power, plv
 
 
-def _single_epoch_tfr(data, is_free_ori, K, Ws, use_fft, decim, shape,
-                      with_plv, with_power):
-    """Compute single trial TFRs, either ITC, power or raw TFR."""
-    tfr_e = np.zeros(shape, dtype=np.float64)  # power or raw TFR
-    # phase lock
-    plv_e = np.zeros(shape, dtype=np.complex128) if with_plv else None
-    n_sources, _, n_times = shape
-    for f, w in enumerate(Ws):
-        tfr_ = cwt(data, [w], use_fft=use_fft, decim=decim)
-        tfr_ = np.asfortranarray(tfr_.reshape(len(data), -1))
-
-        # phase lock and power at freq f
-        if with_plv:
-            plv_f = np.zeros((n_sources, n_times), dtype=np.complex128)
-
-        tfr_f = np.zeros((n_sources, n_times), dtype=np.float64)
-
-        for k, t in enumerate([np.real(tfr_), np.imag(tfr_)]):
-            sol = np.dot(K, t)
-
-            sol_pick_normal = sol
-            if is_free_ori:
-                sol_pick_normal = sol[2::3]
-
-            if with_plv:
-                if k == 0:  # real
-                    plv_f += sol_pick_normal
-                else:  # imag
-                    plv_f += 1j * sol_pick_normal
-
-            if is_free_ori:
-                logger.debug('combining the current components...')
-                sol = combine_xyz(sol, square=with_power)
-            elif with_power:
-                sol *= sol
-            tfr_f += sol
-            del sol
-
-        tfr_e[:, f, :] += tfr_f
-        del tfr_f
+def _single_epoch_tfr(data, is_free_ori, K, Ws, use_fft, decim, power, plv,
+                      sol, with_plv, with_power):
+    """Accumulate single trial TFRs, either ITC, power or raw TFR."""
+    n_freqs, n_times = power.shape[1:]
+    # CWT of all frequencies at once so that the FFT of each signal is
+    # computed only once (with use_fft=True it is shared across wavelets)
+    tfr_all = cwt(data, Ws, use_fft=use_fft, decim=decim)
+    tfr_all = tfr_all.astype(K.dtype, copy=False)
+    n_ch = len(tfr_all)
+    # flatten the (freq, time) axes so blocks of frequencies go through a
+    # single wide GEMM instead of one narrow GEMM per frequency
+    power = power.reshape(len(power), -1)
+    if with_plv:
+        plv = plv.reshape(len(plv), -1)
+    n_freqs_block = max(1, sol.shape[1] // n_times)
+    for f0 in range(0, n_freqs, n_freqs_block):
+        f1 = min(f0 + n_freqs_block, n_freqs)
+        tfr = tfr_all[:, f0:f1].reshape(n_ch, -1)
+        # project the real and imaginary parts of all frequencies of the
+        # block in one complex GEMM
+        if tfr.shape[1] == sol.shape[1]:
+            sol_b = np.dot(K, tfr, out=sol)
+        else:  # smaller tail block (out= needs an exact contiguous match)
+            sol_b = np.dot(K, tfr)
+        block = slice(f0 * n_times, f1 * n_times)
+
+        if is_free_ori:
+            logger.debug('combining the current components...')
+            if with_power:
+                _abs2_xyz_accumulate(sol_b, power[:, block])
+            else:
+                power[:, block] += combine_xyz(sol_b.real, square=False)
+                power[:, block] += combine_xyz(sol_b.imag, square=False)
+        elif with_power:
+            _abs2_accumulate(sol_b, power[:, block])
+        else:
+            power[:, block] += sol_b.real
+            power[:, block] += sol_b.imag
 
         if with_plv:
-            plv_f /= np.abs(plv_f)
-            plv_e[:, f, :] += plv_f
-            del plv_f
-
-    return tfr_e, plv_e
+            # the per-epoch unit phasor is the PLV definition, so the
+            # normalization has to stay inside the epoch loop
+            sol_pick_normal = sol_b[2::3] if is_free_ori else sol_b
+            _unit_phasor_accumulate(sol_pick_normal, plv[:, block])
 
 
 @verbose
@@ -267,43 +438,76 @@ def _source_induced_power(epochs, inverse_operator, freqs, label=None,
                           decim=1, use_fft=False, pca=True, pick_ori="normal",
                           n_jobs=1, with_plv=True, zero_mean=False,
                           prepared=False, method_params=None, use_cps=True,
-                          verbose=None):
+                          dtype=np.float64, verbose=None):
     """Aux function for source induced power."""
+    dtype = np.dtype(dtype)
+    _check_option('dtype', dtype.name, ('float32', 'float64'))
     epochs_data = epochs.get_data()
+    # downcast once here so the workers also receive the smaller arrays
+    epochs_data = epochs_data.astype(dtype, copy=False)
     K, sel, Vh, vertno, is_free_ori, noise_norm = _prepare_source_params(
         inst=epochs, inverse_operator=inverse_operator, label=label,
         lambda2=lambda2, method=method, nave=nave, pca=pca, pick_ori=pick_ori,
         prepared=prepared, method_params=method_params, use_cps=use_cps,
         verbose=verbose)
 
+    # pick the channels and reduce the data rank once for all epochs and
+    # workers (one fancy-index plus one batched GEMM)
+    epochs_data = epochs_data[:, sel]
+    if Vh is not None:
+        epochs_data = np.matmul(Vh.astype(dtype, copy=False), epochs_data)
+
     inv = inverse_operator
+    # the hot loops are all GIL-releasing (FFTs, BLAS GEMMs, jitted
+    # reductions), so prefer threads over processes: the workers then share
+    # one copy of K and the epochs instead of each pickling their own
     parallel, my_compute_source_tfrs, n_jobs = parallel_func(
-        _compute_pow_plv, n_jobs)
+        _compute_pow_plv, n_jobs, prefer='threads')
     Fs = epochs.info['sfreq']  # sampling in Hz
 
     logger.info('Computing source power ...')
 
-    Ws = morlet(Fs, freqs, n_cycles=n_cycles, zero_mean=zero_mean)
-
-    n_jobs = min(n_jobs, len(epochs_data))
-    out = parallel(my_compute_source_tfrs(data=data, K=K, sel=sel, Ws=Ws,
-                                          source_ori=inv['source_ori'],
-                                          use_fft=use_fft, Vh=Vh,
-                                          with_plv=with_plv, with_power=True,
-                                          pick_ori=pick_ori, decim=decim)
-                   for data in np.array_split(epochs_data, n_jobs))
-    power = sum(o[0] for o in out)
-    power /= len(epochs_data)  # average power over epochs
+    if isinstance(n_cycles, (list, tuple, np.ndarray)):
+        n_cycles = tuple(np.asarray(n_cycles).tolist())
+    Ws = _cached_morlet(Fs, tuple(np.asarray(freqs).tolist()), n_cycles,
+                        zero_mean)
+
+    n_epochs = len(epochs_data)
+    if n_jobs <= n_epochs or len(Ws) == 1:
+        # split the epochs over jobs and sum the partial results
+        n_jobs = min(n_jobs, n_epochs)
+        out = parallel(my_compute_source_tfrs(
+            data=data, K=K, Ws=Ws, source_ori=inv['source_ori'],
+            use_fft=use_fft, with_plv=with_plv, with_power=True,
+            pick_ori=pick_ori, decim=decim, dtype=dtype)
+            for data in np.array_split(epochs_data, n_jobs))
+        power = sum(o[0] for o in out)
+        plv = sum(o[1] for o in out) if with_plv else None
+    else:
+        # more jobs than epochs: split the frequencies over jobs instead so
+        # that the extra workers are not left idle, and concatenate the
+        # partial results along the frequency axis
+        n_jobs = min(n_jobs, len(Ws))
+        out = parallel(my_compute_source_tfrs(
+            data=epochs_data, K=K, Ws=[Ws[f] for f in freq_idx],
+            source_ori=inv['source_ori'], use_fft=use_fft,
+            with_plv=with_plv, with_power=True, pick_ori=pick_ori,
+            decim=decim, dtype=dtype)
+            for freq_idx in np.array_split(np.arange(len(Ws)), n_jobs))
+        power = np.concatenate([o[0] for o in out], axis=1)
+        plv = (np.concatenate([o[1] for o in out], axis=1) if with_plv
+               else None)
+    if noise_norm is not None:
+        # fuse the epoch average and the noise normalization into a single
+        # pass over the power array
+        scale = (noise_norm * noise_norm) / n_epochs
+        power *= scale[:, :, np.newaxis]
+    else:
+        power /= n_epochs  # average power over epochs
 
     if with_plv:
-        plv = sum(o[1] for o in out)
         plv = np.abs(plv)
-        plv /= len(epochs_data)  # average power over epochs
-    else:
-        plv = None
-
-    if noise_norm is not None:
-        power *= noise_norm[:, :, np.newaxis] ** 2
+        plv /= n_epochs  # average over epochs
 
     return power, plv, vertno
 
@@ -314,7 +518,8 @@ def source_induced_power(epochs, inverse_operator, freqs, label=None,
                          decim=1, use_fft=False, pick_ori=None,
                          baseline=None, baseline_mode='logratio', pca=True,
                          n_jobs=1, zero_mean=False, prepared=False,
-                         method_params=None, use_cps=True, verbose=None):
+                         method_params=None, use_cps=True, dtype=np.float64,
+                         verbose=None):
     """Compute induced power and phase lock.
 
     Computation can optionally be restricted in a label.
@@ -382,6 +587,12 @@ def source_induced_power(epochs, inverse_operator, freqs, label=None,
     %(use_cps_restricted)s
 
         .. versionadded:: 0.20
+    dtype : np.float64 | np.float32
+        Precision of the computation. Using np.float32 halves the memory
+        traffic of the pipeline and is usually sufficient for power
+        estimates. Defaults to np.float64.
+
+        .. versionadded:: 0.24
     %(verbose)s
 
     Returns
@@ -398,7 +609,7 @@ def source_induced_power(epochs, inverse_operator, freqs, label=None,
         method=method, nave=nave, n_cycles=n_cycles, decim=decim,
         use_fft=use_fft, pick_ori=pick_ori, pca=pca, n_jobs=n_jobs,
         method_params=method_params, zero_mean=zero_mean,
-        prepared=prepared, use_cps=use_cps)
+        prepared=prepared, use_cps=use_cps, dtype=dtype)
 
     # Run baseline correction
     power = rescale(power, epochs.times[::decim], baseline, baseline_mode,
@@ -573,7 +784,7 @@ def _compute_source_psd_epochs(epochs, inverse_operator, lambda2=1. / 9.,
         verbose=verbose)
     # Simplify code with a tiny (rel. to other computations) penalty for eye
     # mult
-    Vh = np.eye(K.shape[0]) if Vh is None else Vh
+    Vh = np.eye(K.shape[1]) if Vh is None else Vh
 
     # split the inverse operator
     if inv_split is not None:
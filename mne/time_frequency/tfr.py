@@ -219,7 +219,7 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
     out : array, shape (n_signals, n_freqs, n_time_decim)
         The time-frequency transform of the signals.
     """
-    fft, ifft = _import_fft(('fft', 'ifft'))
+    fft, ifft, rfft = _import_fft(('fft', 'ifft', 'rfft'))
     _check_option('mode', mode, ['same', 'valid', 'full'])
     decim = _check_decim(decim)
     X = np.asarray(X)
@@ -236,9 +236,18 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
             fft_Ws[i] = fft(W, fsize)
 
     # Make generator looping across signals
+    use_rfft = use_fft and np.isrealobj(X)
+    if use_rfft:
+        n_half = fsize // 2 + 1
+        fft_x = np.empty(fsize, dtype=np.complex128)
     tfr = np.zeros((n_freqs, n_times_out), dtype=np.complex128)
     for x in X:
-        if use_fft:
+        if use_rfft:
+            # real input: only half the spectrum needs to be computed, the
+            # rest follows from Hermitian symmetry
+            fft_x[:n_half] = rfft(x, fsize)
+            fft_x[n_half:] = fft_x[fsize - n_half:0:-1].conj()
+        elif use_fft:
             fft_x = fft(x, fsize)
 
         # Loop across wavelets